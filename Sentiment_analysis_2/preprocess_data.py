@@ -10,44 +10,29 @@ omdb_data_path       = DATA_DIR / "movie_data.csv"
 box_office_mojo_path = DATA_DIR / "box_office_data.csv"
 output_merged_path   = DATA_DIR / "merged_movie_data.csv"
 
-df_tmdb            = pd.read_csv(tmdb_data_path)
-df_omdb            = pd.read_csv(omdb_data_path)
-df_box_office_mojo = pd.read_csv(box_office_mojo_path)
-
-# Load datasets
-df_tmdb = pd.read_csv(tmdb_data_path)
-df_omdb = pd.read_csv(omdb_data_path)
-df_box_office_mojo = pd.read_csv(box_office_mojo_path)
-
-print("--- Original TMDb Data ---")
-print(df_tmdb.info())
-print(df_tmdb.head())
-
-print("\n--- Original OMDb Data (movie_data.csv) ---")
-print(df_omdb.info())
-print(df_omdb.head())
-
-print("\n--- Original Box Office Mojo Data ---")
-print(df_box_office_mojo.info())
-print(df_box_office_mojo.head())
+def load_datasets(tmdb_path=tmdb_data_path, omdb_path=omdb_data_path, box_office_path=box_office_mojo_path):
+    df_tmdb            = pd.read_csv(tmdb_path)
+    df_omdb            = pd.read_csv(omdb_path)
+    df_box_office_mojo = pd.read_csv(box_office_path)
+    return df_tmdb, df_omdb, df_box_office_mojo
 
 # --- Preprocessing and Renaming --- 
 
-# Standardize title columns for merging
-df_tmdb.rename(columns={"title": "Title"}, inplace=True)
-df_box_office_mojo.rename(columns={"title": "Title"}, inplace=True)
-# df_omdb already has "Title"
-
-# Select and rename columns from TMDb data
-df_tmdb_processed = df_tmdb[["Title", "revenue", "budget", "vote_average", "vote_count", "release_date", "genres"]].copy()
-df_tmdb_processed.rename(columns={
-    "revenue": "TMDb_Revenue",
-    "budget": "TMDb_Budget",
-    "vote_average": "TMDb_VoteAverage",
-    "vote_count": "TMDb_VoteCount",
-    "release_date": "TMDb_ReleaseDate",
-    "genres": "TMDb_Genres"
-}, inplace=True)
+def process_tmdb(df_tmdb):
+    # Standardize title columns for merging
+    df_tmdb = df_tmdb.rename(columns={"title": "Title"})
+
+    # Select and rename columns from TMDb data
+    df_tmdb_processed = df_tmdb[["Title", "revenue", "budget", "vote_average", "vote_count", "release_date", "genres"]].copy()
+    df_tmdb_processed.rename(columns={
+        "revenue": "TMDb_Revenue",
+        "budget": "TMDb_Budget",
+        "vote_average": "TMDb_VoteAverage",
+        "vote_count": "TMDb_VoteCount",
+        "release_date": "TMDb_ReleaseDate",
+        "genres": "TMDb_Genres"
+    }, inplace=True)
+    return df_tmdb_processed
 
 # Process OMDb data (df_omdb)
 # Extract specific ratings from the 'Ratings' column (string of list of dicts)
@@ -66,69 +51,89 @@ def parse_omdb_ratings(ratings_str):
     except:
         return pd.Series({})
 
-ratings_extracted = df_omdb["Ratings"].apply(parse_omdb_ratings)
-df_omdb_processed = pd.concat([df_omdb[["Title", "Year", "Rated", "Runtime", "Genre", "Director", "Actors", "Plot", "Language", "Metascore", "imdbRating", "imdbVotes"]], ratings_extracted], axis=1)
-
-# Clean OMDb imdbVotes (e.g., "1,234,567" to 1234567)
-df_omdb_processed["imdbVotes"] = df_omdb_processed["imdbVotes"].astype(str).str.replace(",", "", regex=False).fillna(0).astype(int)
-df_omdb_processed.rename(columns={
-    "Year": "OMDb_Year",
-    "Rated": "OMDb_Rated",
-    "Runtime": "OMDb_Runtime",
-    "Genre": "OMDb_Genre",
-    "Director": "OMDb_Director",
-    "Actors": "OMDb_Actors",
-    "Plot": "OMDb_Plot",
-    "Language": "OMDb_Language",
-    "Metascore": "OMDb_Metascore_Direct", # Already numeric in source
-    "imdbRating": "OMDb_imdbRating_Direct" # Already numeric in source
-}, inplace=True)
-
-# Convert extracted ratings to numeric
-for col in ["OMDb_IMDb_Rating", "OMDb_Metacritic_Rating"]:
-    if col in df_omdb_processed.columns:
-        df_omdb_processed[col] = pd.to_numeric(df_omdb_processed[col], errors='coerce')
-if "OMDb_RottenTomatoes_Rating" in df_omdb_processed.columns:
-     df_omdb_processed["OMDb_RottenTomatoes_Rating"] = pd.to_numeric(df_omdb_processed["OMDb_RottenTomatoes_Rating"].str.replace("%", "", regex=False), errors='coerce') / 100.0
-
-# Box Office Mojo data is already clean (Title, worldwide_gross)
-df_box_office_mojo.rename(columns={"worldwide_gross": "BoxOfficeMojo_WorldwideGross"}, inplace=True)
+def process_omdb(df_omdb):
+    ratings_extracted = df_omdb["Ratings"].apply(parse_omdb_ratings)
+    df_omdb_processed = pd.concat([df_omdb[["Title", "Year", "Rated", "Runtime", "Genre", "Director", "Actors", "Plot", "Language", "Metascore", "imdbRating", "imdbVotes"]], ratings_extracted], axis=1)
+
+    # Clean OMDb imdbVotes (e.g., "1,234,567" to 1234567)
+    df_omdb_processed["imdbVotes"] = df_omdb_processed["imdbVotes"].astype(str).str.replace(",", "", regex=False).fillna(0).astype(int)
+    df_omdb_processed.rename(columns={
+        "Year": "OMDb_Year",
+        "Rated": "OMDb_Rated",
+        "Runtime": "OMDb_Runtime",
+        "Genre": "OMDb_Genre",
+        "Director": "OMDb_Director",
+        "Actors": "OMDb_Actors",
+        "Plot": "OMDb_Plot",
+        "Language": "OMDb_Language",
+        "Metascore": "OMDb_Metascore_Direct", # Already numeric in source
+        "imdbRating": "OMDb_imdbRating_Direct" # Already numeric in source
+    }, inplace=True)
+
+    # Convert extracted ratings to numeric
+    for col in ["OMDb_IMDb_Rating", "OMDb_Metacritic_Rating"]:
+        if col in df_omdb_processed.columns:
+            df_omdb_processed[col] = pd.to_numeric(df_omdb_processed[col], errors='coerce')
+    if "OMDb_RottenTomatoes_Rating" in df_omdb_processed.columns:
+         df_omdb_processed["OMDb_RottenTomatoes_Rating"] = pd.to_numeric(df_omdb_processed["OMDb_RottenTomatoes_Rating"].str.replace("%", "", regex=False), errors='coerce') / 100.0
+    return df_omdb_processed
+
+def process_box_office(df_box_office_mojo):
+    # Box Office Mojo data is already clean (Title, worldwide_gross)
+    return df_box_office_mojo.rename(columns={"title": "Title", "worldwide_gross": "BoxOfficeMojo_WorldwideGross"})
 
 # --- Merging DataFrames --- 
-# Start with TMDb data as the base
-df_merged = df_tmdb_processed.copy()
-
-# Merge with OMDb data
-df_merged = pd.merge(df_merged, df_omdb_processed, on="Title", how="left")
-
-# Merge with Box Office Mojo data
-df_merged = pd.merge(df_merged, df_box_office_mojo, on="Title", how="left")
-
-print("\n--- Merged Data ---")
-print(df_merged.info())
-print(df_merged.head())
-print("Missing values in merged data:\n", df_merged.isnull().sum())
-
-# Save the merged dataframe
-df_merged.to_csv(output_merged_path, index=False)
-print(f"\nMerged data saved to {output_merged_path}")
-
-# Further define which revenue column to use as primary
-# For now, we have TMDb_Revenue and BoxOfficeMojo_WorldwideGross
-# User's Sentiment.py used 'worldwide_gross' from a manually collected box_office_data, which is now df_box_office_mojo
-# So, BoxOfficeMojo_WorldwideGross should be the primary one.
-
-if 'BoxOfficeMojo_WorldwideGross' in df_merged.columns:
-    df_merged['Final_Revenue'] = df_merged['BoxOfficeMojo_WorldwideGross']
-elif 'TMDb_Revenue' in df_merged.columns:
-    df_merged['Final_Revenue'] = df_merged['TMDb_Revenue']
-else:
-    df_merged['Final_Revenue'] = None # Or handle error
-
-print("\n--- Merged Data with Final_Revenue column ---")
-print(df_merged[['Title', 'TMDb_Revenue', 'BoxOfficeMojo_WorldwideGross', 'Final_Revenue']].head())
-
-# Save again with Final_Revenue if you want it in the CSV
-df_merged.to_csv(output_merged_path, index=False)
-print(f"Final merged data (with Final_Revenue) saved to {output_merged_path}")
-
+def merge_datasets(df_tmdb_processed, df_omdb_processed, df_box_office_mojo):
+    # Start with TMDb data as the base
+    df_merged = df_tmdb_processed.copy()
+
+    # Merge with OMDb data
+    df_merged = pd.merge(df_merged, df_omdb_processed, on="Title", how="left")
+
+    # Merge with Box Office Mojo data
+    df_merged = pd.merge(df_merged, df_box_office_mojo, on="Title", how="left")
+
+    # Further define which revenue column to use as primary
+    # For now, we have TMDb_Revenue and BoxOfficeMojo_WorldwideGross
+    # User's Sentiment.py used 'worldwide_gross' from a manually collected box_office_data, which is now df_box_office_mojo
+    # So, BoxOfficeMojo_WorldwideGross should be the primary one.
+    if 'BoxOfficeMojo_WorldwideGross' in df_merged.columns:
+        df_merged['Final_Revenue'] = df_merged['BoxOfficeMojo_WorldwideGross']
+    elif 'TMDb_Revenue' in df_merged.columns:
+        df_merged['Final_Revenue'] = df_merged['TMDb_Revenue']
+    else:
+        df_merged['Final_Revenue'] = None # Or handle error
+    return df_merged
+
+def main():
+    # Load datasets
+    df_tmdb, df_omdb, df_box_office_mojo = load_datasets()
+
+    print("--- Original TMDb Data ---")
+    print(df_tmdb.info())
+    print(df_tmdb.head())
+
+    print("\n--- Original OMDb Data (movie_data.csv) ---")
+    print(df_omdb.info())
+    print(df_omdb.head())
+
+    print("\n--- Original Box Office Mojo Data ---")
+    print(df_box_office_mojo.info())
+    print(df_box_office_mojo.head())
+
+    df_merged = merge_datasets(process_tmdb(df_tmdb), process_omdb(df_omdb), process_box_office(df_box_office_mojo))
+
+    print("\n--- Merged Data ---")
+    print(df_merged.info())
+    print(df_merged.head())
+    print("Missing values in merged data:\n", df_merged.isnull().sum())
+
+    print("\n--- Merged Data with Final_Revenue column ---")
+    print(df_merged[['Title', 'TMDb_Revenue', 'BoxOfficeMojo_WorldwideGross', 'Final_Revenue']].head())
+
+    # Save the merged dataframe (with Final_Revenue)
+    df_merged.to_csv(output_merged_path, index=False)
+    print(f"Final merged data (with Final_Revenue) saved to {output_merged_path}")
+
+if __name__ == '__main__':
+    main()
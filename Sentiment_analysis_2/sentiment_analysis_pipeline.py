@@ -226,6 +226,50 @@ def perform_correlation_analysis(merged_movie_data_path, sentiment_summary_df, o
     else:
         print("Dataset too small for train/test split in linear regression example.")
 
+def perform_streaming_correlation_analysis(merged_movie_data_path, sentiment_summary_df, output_dir='.', chunksize=100_000):
+    # Same outputs as perform_correlation_analysis (minus the plots), but the merged
+    # movie data is read in chunks so it never has to fit in memory at once
+    from streaming_stats import CovarianceAccumulator
+
+    if not os.path.exists(merged_movie_data_path):
+        print(f"Error: {merged_movie_data_path} not found. Skipping correlation analysis.")
+        return
+
+    sentiment_cols = ['Positive (%)', 'Negative (%)', 'Neutral (%)']
+    accumulator = CovarianceAccumulator(['Final_Revenue'] + sentiment_cols)
+    combined_csv_path = os.path.join(output_dir, 'combined_movie_sentiment_data.csv')
+
+    for i, chunk in enumerate(pd.read_csv(merged_movie_data_path, chunksize=chunksize)):
+        if 'Final_Revenue' not in chunk.columns:
+            print("Error: 'Final_Revenue' column not found in combined data. Skipping correlation.")
+            return
+        df_combined = pd.merge(chunk, sentiment_summary_df, left_on='Title', right_on='Movie', how='left')
+        df_combined.drop(columns=['Movie'], inplace=True)
+        df_combined.to_csv(combined_csv_path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        accumulator.update(df_combined)
+    print(f"Saved combined movie and sentiment data to {combined_csv_path}")
+
+    if accumulator.n < 2:
+        print("Not enough data points after cleaning for correlation analysis. Skipping.")
+        return
+
+    correlation_matrix = accumulator.correlation()
+    print("\n--- Correlation Matrix (Revenue vs Sentiment) ---")
+    print(correlation_matrix)
+
+    correlation_matrix.to_csv(os.path.join(output_dir, 'correlation_matrix.csv'))
+    print(f"Saved correlation matrix to {os.path.join(output_dir, 'correlation_matrix.csv')}")
+
+    if accumulator.n >= 4:
+        fit = accumulator.linear_regression('Final_Revenue')
+        print(f"\n--- Linear Regression (fitted on all {accumulator.n} data points) ---")
+        print(f"Coefficients: {fit['coef'].to_numpy()}")
+        print(f"Intercept: {fit['intercept']}")
+        print(f"Mean Squared Error: {fit['mse']}")
+        print(f"R-Squared: {fit['r2']}")
+    else:
+        print("Dataset too small for train/test split in linear regression example.")
+
 def main():
     reviews_file_path = 'imdb_reviews.txt' # Assumes it's in the current directory
     merged_movie_data_path = 'merged_movie_data.csv' # From preprocess_data.py
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+
+# Single-pass statistics that work on chunks of data and can be merged across
+# shards, so the correlation and revenue summaries don't need the whole
+# dataset in memory.
+#   - CovarianceAccumulator: means, covariance, correlation matrix and a
+#     least squares fit (Welford / Chan et al. pairwise updates)
+#   - TDigest: quantile sketch used for revenue quantiles, ECDF and the
+#     Lorenz (concentration) curve
+
+
+class CovarianceAccumulator:
+    """Running mean and co-moment matrix for a fixed set of columns.
+
+    Rows with a missing value in any of the columns are skipped, same as
+    calling ``dropna(subset=columns)`` before ``.corr()``.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k)) # sum of (x - mean)(x - mean)^T
+
+    def update(self, chunk):
+        """Add a chunk (DataFrame with ``columns``) to the running statistics."""
+        values = chunk[self.columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return self
+        batch = CovarianceAccumulator(self.columns)
+        batch.n = len(values)
+        batch.mean = values.mean(axis=0)
+        centered = values - batch.mean
+        batch.comoment = centered.T @ centered
+        return self.merge(batch)
+
+    def merge(self, other):
+        """Combine with the statistics of another shard (Chan et al. update)."""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns.")
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * self.n * other.n / n
+        self.mean = self.mean + delta * other.n / n
+        self.n = n
+        return self
+
+    def covariance(self, ddof=1):
+        if self.n <= ddof:
+            raise ValueError("Not enough rows for covariance.")
+        return pd.DataFrame(self.comoment / (self.n - ddof), index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        """Pearson correlation matrix, same layout as ``DataFrame.corr()``."""
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.outer(std, std)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def linear_regression(self, target):
+        """Ordinary least squares of ``target`` on the other columns.
+
+        Returns a dict with ``coef`` (Series), ``intercept``, ``mse`` and ``r2``,
+        matching what LinearRegression fitted on all rows would give.
+        """
+        features = [c for c in self.columns if c != target]
+        x_idx = [self.columns.index(c) for c in features]
+        y_idx = self.columns.index(target)
+
+        sxx = self.comoment[np.ix_(x_idx, x_idx)]
+        sxy = self.comoment[x_idx, y_idx]
+        syy = self.comoment[y_idx, y_idx]
+        # lstsq instead of solve: sentiment percentages sum to 100 so sxx is singular
+        coef = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        sse = syy - coef @ sxy
+        return {
+            'coef': pd.Series(coef, index=features),
+            'intercept': self.mean[y_idx] - coef @ self.mean[x_idx],
+            'mse': sse / self.n,
+            'r2': 1 - sse / syy if syy > 0 else np.nan,
+        }
+
+
+class TDigest:
+    """Mergeable t-digest quantile sketch (Dunning & Ertl).
+
+    Keeps about ``compression / 2`` centroids, with small ones near the
+    tails, so extreme quantiles stay accurate while memory stays bounded.
+    """
+
+    def __init__(self, compression=200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.buffer = []
+        self.buffered = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Add an array/Series of values; NaN and infinite values are ignored."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return self
+        self.buffer.append(values)
+        self.buffered += len(values)
+        self.count += len(values)
+        self.total += values.sum()
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        if self.buffered >= 20 * self.compression:
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """Combine with the sketch of another shard."""
+        if other.count == 0:
+            return self
+        self.buffer.extend(other.buffer)
+        self.buffered += other.buffered
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.means = np.concatenate([self.means, other.means])
+        self.weights = np.concatenate([self.weights, other.weights])
+        self._compress()
+        return self
+
+    def _scale(self, q):
+        # k1 scale function: centroids shrink towards q = 0 and q = 1
+        return self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+    def _inverse_scale(self, k):
+        # q for a given k, 1 past the top of the scale
+        if k >= self.compression / 4:
+            return 1.0
+        return (np.sin(2 * np.pi * k / self.compression) + 1) / 2
+
+    def _compress(self):
+        means = np.concatenate([self.means] + self.buffer)
+        weights = np.concatenate([self.weights] + [np.ones(len(b)) for b in self.buffer])
+        self.buffer, self.buffered = [], 0
+        if len(means) == 0:
+            return
+
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cum_weight = np.cumsum(weights)
+        total = cum_weight[-1]
+
+        # greedy pass: each centroid takes the following points for as long as
+        # it spans at most one unit of k, i.e. k(q_left + w) - k(q_left) <= 1
+        starts = []
+        start = 0
+        while start < len(means):
+            starts.append(start)
+            q_left = cum_weight[start - 1] / total if start > 0 else 0.0
+            q_limit = self._inverse_scale(self._scale(q_left) + 1)
+            # always take at least one point, even if it alone is over the limit
+            end = np.searchsorted(cum_weight, q_limit * total * (1 + 1e-12), side='right')
+            start = max(end, start + 1)
+
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def _centroids(self):
+        if self.buffer:
+            self._compress()
+        if self.count == 0:
+            raise ValueError("TDigest is empty.")
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return self.means, centers
+
+    def quantile(self, q):
+        """Approximate quantile(s) for ``q`` in [0, 1]."""
+        means, centers = self._centroids()
+        xp = np.r_[0, centers, self.count]
+        fp = np.r_[self.min, means, self.max]
+        return np.interp(np.asarray(q, dtype=float) * self.count, xp, fp)
+
+    def cdf(self, x):
+        """Approximate fraction of values <= ``x``."""
+        means, centers = self._centroids()
+        xp = np.r_[self.min, means, self.max]
+        fp = np.r_[0, centers, self.count]
+        return np.interp(np.asarray(x, dtype=float), xp, fp, left=0, right=self.count) / self.count
+
+    def ecdf(self, n_points=200):
+        """Return (values, cumulative proportion) arrays for plotting an ECDF."""
+        proportions = np.linspace(0, 1, n_points)
+        return self.quantile(proportions), proportions
+
+    def lorenz_curve(self, n_points=101):
+        """Return (share of films, share of total revenue) for the Lorenz curve.
+
+        Films are ordered from lowest to highest revenue, so the curve at 0.8
+        is the share earned by the bottom 80%.
+        """
+        population = np.linspace(0, 1, n_points)
+        return population, self._revenue_share(population)
+
+    def top_share(self, fraction=0.2):
+        """Share of the total earned by the top ``fraction`` of films."""
+        return 1 - float(self._revenue_share(1 - fraction))
+
+    def _revenue_share(self, population):
+        self._centroids()
+        cum_weight = np.r_[0, np.cumsum(self.weights)]
+        cum_total = np.r_[0, np.cumsum(self.means * self.weights)]
+        return np.interp(np.asarray(population) * self.count, cum_weight, cum_total) / cum_total[-1]
+
+
+def revenue_sketch(csv_path, column='BoxOffice', min_value=None, chunksize=100_000, compression=200):
+    """Build a TDigest over one column of a CSV, reading it in chunks."""
+    digest = TDigest(compression)
+    for chunk in pd.read_csv(csv_path, usecols=[column], chunksize=chunksize):
+        values = pd.to_numeric(chunk[column], errors='coerce')
+        if min_value is not None:
+            values = values[values > min_value]
+        digest.update(values)
+    return digest
+
+
+def main():
+    # Revenue summary behind the report's ECDF and "80/20" figures, computed in chunks
+    csv_path = '../data_collection/omdb_cleaned.csv'
+    digest = revenue_sketch(csv_path, min_value=1e5)
+
+    print(f"Films with BoxOffice > $100k: {digest.count}")
+    for q in [0.1, 0.25, 0.5, 0.75, 0.9, 0.99]:
+        print(f"{q:>5.0%} quantile: ${digest.quantile(q):,.0f}")
+    print(f"Share of receipts from the top 20% of films: {digest.top_share(0.2):.1%}")
+
+
+if __name__ == '__main__':
+    main()
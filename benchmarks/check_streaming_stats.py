@@ -0,0 +1,93 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# this script checks the streaming statistics in Sentiment_analysis_2/streaming_stats.py
+# against exact numpy/pandas results, including the many-shard and small-chunk
+# cases where a sketch that compresses repeatedly can drift.
+
+# dynamic paths to use on different PCs
+base_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(base_dir, ".."))
+sys.path.insert(0, os.path.join(project_root, "Sentiment_analysis_2"))
+
+from streaming_stats import CovarianceAccumulator, TDigest
+
+N_VALUES = 1_000_000
+QUANTILES = np.array([0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999])
+
+# limits for a digest with the default compression of 200; a single compress
+# stays well inside them, so these catch accuracy lost to repeated merges
+MAX_RANK_ERROR = 5e-4 # |cdf(exact quantile) - q|, worst over QUANTILES
+MAX_P999_ERROR = 0.15 # relative value error at the 99.9th percentile
+MAX_TOP_SHARE_ERROR = 5e-4 # absolute error of the top-20% revenue share
+
+
+def digest_from_shards(values, n_shards):
+    digests = [TDigest().update(shard) for shard in np.array_split(values, n_shards)]
+    digest = digests[0]
+    for other in digests[1:]:
+        digest.merge(other)
+    return digest
+
+
+def digest_from_chunks(values, chunksize):
+    digest = TDigest()
+    for start in range(0, len(values), chunksize):
+        digest.update(values[start:start + chunksize])
+    return digest
+
+
+def check_digest(name, digest, values, reference_rank_error=None):
+    exact = np.quantile(values, QUANTILES)
+    rank_error = np.abs(digest.cdf(exact) - QUANTILES).max()
+    p999_error = abs(digest.quantile(0.999) / exact[-1] - 1)
+    ordered = np.sort(values)
+    exact_top_share = ordered[-len(values) // 5:].sum() / ordered.sum()
+    top_share_error = abs(digest.top_share(0.2) - exact_top_share)
+
+    ok = rank_error <= MAX_RANK_ERROR and p999_error <= MAX_P999_ERROR and top_share_error <= MAX_TOP_SHARE_ERROR
+    if reference_rank_error is not None:
+        # merging many shards should not be much worse than compressing once
+        ok = ok and rank_error <= 2 * reference_rank_error
+    print(f"{'ok  ' if ok else 'FAIL'} {name:<24} centroids {len(digest.means):4d}  rank error {rank_error:.1e}  "
+          f"p99.9 error {p999_error:6.2%}  top-20% share error {top_share_error:.1e}")
+    return ok, rank_error
+
+
+def check_covariance(values):
+    df = pd.DataFrame(values, columns=["Final_Revenue", "Positive (%)", "Negative (%)", "Neutral (%)"])
+    df.iloc[::97, 2] = np.nan
+    shards = []
+    for start in range(0, len(df), 7_000):
+        shards.append(CovarianceAccumulator(df.columns).update(df.iloc[start:start + 7_000]))
+    accumulator = shards[0]
+    for other in shards[1:]:
+        accumulator.merge(other)
+
+    error = np.abs(accumulator.correlation().to_numpy() - df.dropna().corr().to_numpy()).max()
+    ok = error <= 1e-9
+    print(f"{'ok  ' if ok else 'FAIL'} {'correlation, 15 shards':<24} max error {error:.1e}")
+    return ok
+
+
+def main():
+    rng = np.random.default_rng(0)
+    revenue = np.exp(rng.normal(17, 1.8, N_VALUES))
+
+    ok, reference = check_digest("1 merge", digest_from_shards(revenue, 2), revenue)
+    results = [
+        ok,
+        check_digest("1000 merges", digest_from_shards(revenue, 1000), revenue, reference)[0],
+        check_digest("4000-row chunks", digest_from_chunks(revenue, 4000), revenue, reference)[0],
+        check_digest("100k-row chunks", digest_from_chunks(revenue, 100_000), revenue, reference)[0],
+        check_covariance(rng.normal(size=(100_000, 4)) @ rng.normal(size=(4, 4)) + 1e6),
+    ]
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# this script generates synthetic movie datasets in the same schemas as the
+# files we collected (OMDb, TMDb, Box Office Mojo and the IMDb review dump),
+# so the pipeline and the report code can be run at sizes we never scraped.
+
+# dynamic paths to use on different PCs
+base_dir = os.path.dirname(os.path.abspath(__file__))
+synthetic_dir = os.path.join(base_dir, "synthetic")
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# rows are generated and appended in chunks so 1M movies fit in memory
+CHUNK_SIZE = 50_000
+
+# written last, so a dataset without a matching manifest is incomplete or stale;
+# bump the version whenever a change to this script changes its output
+MANIFEST_FILE = "manifest.json"
+GENERATOR_VERSION = 3
+
+# share of movies that reuse an earlier title (about 1.7% in omdb_cleaned.csv)
+REMAKE_FRACTION = 0.02
+
+GENRES = ["Action", "Adventure", "Animation", "Biography", "Comedy", "Crime",
+          "Documentary", "Drama", "Family", "Fantasy", "History", "Horror",
+          "Music", "Mystery", "Romance", "Sci-Fi", "Sport", "Thriller", "War", "Western"]
+RATED = ["G", "PG", "PG-13", "R", "NC-17", "Not Rated"]
+LANGUAGES = ["English", "Spanish", "French", "German", "Italian", "Japanese", "Korean", "Hindi", "Mandarin"]
+COUNTRIES = ["United States", "United Kingdom", "France", "Germany", "Canada", "Japan", "India", "Australia"]
+FIRST_NAMES = ["Greta", "Christopher", "Margot", "Ryan", "Emily", "Cillian", "Matt", "Issa",
+               "Tom", "Anne", "Chuck", "Andrew", "Sofia", "Denis", "Jordan", "Ava", "Lu", "Kai"]
+LAST_NAMES = ["Gerwig", "Nolan", "Robbie", "Gosling", "Blunt", "Murphy", "Damon", "Rae",
+              "Post", "Archer", "Norris", "Prine", "Coppola", "Villeneuve", "Peele", "Chen", "Bird"]
+TITLE_WORDS = ["Midnight", "Express", "Shadow", "Return", "Last", "Summer", "Grizzly", "Empire",
+               "Secret", "City", "Dream", "Black", "River", "Storm", "Heart", "Game", "Night", "Star"]
+
+POSITIVE_PHRASES = ["The performances were brilliant and the story kept me hooked.",
+                    "A beautiful, funny and moving film that I loved from start to finish.",
+                    "Great direction, wonderful cinematography and an amazing soundtrack.",
+                    "One of the best movies I have seen this year, highly recommended."]
+NEGATIVE_PHRASES = ["The plot was boring and the dialogue was painfully bad.",
+                    "A terrible waste of time with awful pacing and weak acting.",
+                    "I hated the ending and the whole thing felt like a disappointing mess.",
+                    "Poorly written, badly edited and far too long."]
+NEUTRAL_PHRASES = ["The film runs for about two hours.",
+                   "It was released in theaters during the summer.",
+                   "The movie is based on an earlier screenplay.",
+                   "I watched it with my family on a weekend."]
+
+
+def _join_choices(rng, pool, low, high, sort=False):
+    # comma separated picks, e.g. "Adventure, Comedy, Fantasy"; OMDb lists
+    # genres alphabetically, so sorting keeps the number of distinct values realistic
+    picks = rng.choice(pool, size=rng.integers(low, high + 1), replace=False)
+    return ", ".join(sorted(picks) if sort else picks)
+
+
+def generate_movies(rng, start, n):
+    """Generate ``n`` synthetic movies with ids starting at ``start``.
+
+    Revenue is log-normal so the distribution is as skewed as the real
+    BoxOffice column, and budget, votes and ratings are correlated with it.
+    """
+    ids = np.arange(start, start + n)
+    log_budget = rng.normal(16.5, 1.4, n)
+    log_revenue = 0.8 * log_budget + rng.normal(4.0, 1.6, n)
+    budget = np.round(np.exp(log_budget), -3).astype(np.int64)
+    revenue = np.exp(log_revenue).astype(np.int64)
+    quality = np.clip(rng.normal(6.3, 1.1, n), 1.0, 9.8)
+    votes = np.exp(0.5 * log_revenue + rng.normal(0.0, 1.0, n) - 1.0).astype(np.int64) + 5
+    metascore = np.clip(np.round(quality * 10 + rng.normal(0, 8, n)), 1, 100).astype(int)
+    tomatoes = np.clip(np.round(quality * 11 + rng.normal(0, 12, n) - 5), 0, 100).astype(int)
+    year = rng.integers(1970, 2025, n)
+    runtime = np.clip(rng.normal(108, 20, n), 60, 240).astype(int)
+
+    # a few movies are remakes that reuse the title of an earlier one, like the
+    # duplicate titles in omdb_cleaned.csv; they fan out in the Title merges
+    remake = rng.random(n) < REMAKE_FRACTION
+    title_ids = np.where(remake & (ids > 0), rng.integers(0, np.maximum(ids, 1)), ids)
+    titles = [f"{TITLE_WORDS[i % len(TITLE_WORDS)]} {TITLE_WORDS[(i // len(TITLE_WORDS)) % len(TITLE_WORDS)]} {i}"
+              for i in title_ids]
+    return pd.DataFrame({
+        "Title": titles,
+        "imdbID": [f"tt{i + 10_000_000}" for i in ids],
+        "tmdbId": ids + 1,
+        "Year": year,
+        "Released": pd.to_datetime(year.astype(str) + "-01-01") + pd.to_timedelta(rng.integers(0, 365, n), unit="D"),
+        "Rated": rng.choice(RATED, n),
+        "Runtime": runtime,
+        "Genre": [_join_choices(rng, GENRES, 1, 3, sort=True) for _ in range(n)],
+        "Director": [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(n)],
+        "Actors": [", ".join(f"{a} {b}" for a, b in zip(rng.choice(FIRST_NAMES, 3), rng.choice(LAST_NAMES, 3)))
+                   for _ in range(n)],
+        "Language": [_join_choices(rng, LANGUAGES, 1, 2) for _ in range(n)],
+        "Country": [_join_choices(rng, COUNTRIES, 1, 2) for _ in range(n)],
+        "imdbRating": np.round(quality, 1),
+        "imdbVotes": votes,
+        "Metascore": metascore,
+        "RottenTomatoes": tomatoes,
+        "budget": budget,
+        "revenue": revenue,
+        # box office mojo and tmdb never report exactly the same number
+        "worldwide_gross": (revenue * rng.normal(1.0, 0.03, n)).astype(np.int64),
+        "has_boxoffice": rng.random(n) > 0.33,
+    })
+
+
+def to_omdb_raw(movies):
+    # same columns as Sentiment_analysis_2/movie_data.csv
+    ratings = [str([{"Source": "Internet Movie Database", "Value": f"{r}/10"},
+                    {"Source": "Rotten Tomatoes", "Value": f"{t}%"},
+                    {"Source": "Metacritic", "Value": f"{m}/100"}])
+               for r, t, m in zip(movies["imdbRating"], movies["RottenTomatoes"], movies["Metascore"])]
+    box_office = np.where(movies["has_boxoffice"], movies["revenue"].map("${:,}".format), "N/A")
+    return pd.DataFrame({
+        "Title": movies["Title"],
+        "Year": movies["Year"],
+        "Rated": movies["Rated"],
+        "Released": movies["Released"].dt.strftime("%d %b %Y"),
+        "Runtime": movies["Runtime"].astype(str) + " min",
+        "Genre": movies["Genre"],
+        "Director": movies["Director"],
+        "Writer": movies["Director"],
+        "Actors": movies["Actors"],
+        "Plot": "A synthetic film about " + movies["Genre"].str.lower() + " directed by " + movies["Director"] + ".",
+        "Language": movies["Language"],
+        "Country": movies["Country"],
+        "Awards": "N/A",
+        "Poster": "N/A",
+        "Ratings": ratings,
+        "Metascore": movies["Metascore"],
+        "imdbRating": movies["imdbRating"],
+        "imdbVotes": movies["imdbVotes"].map("{:,}".format),
+        "imdbID": movies["imdbID"],
+        "Type": "movie",
+        "DVD": "N/A",
+        "BoxOffice": box_office,
+        "Production": "N/A",
+        "Website": "N/A",
+        "Response": True,
+    })
+
+
+def to_omdb_cleaned(movies):
+    # same columns as data_collection/omdb_cleaned.csv
+    return pd.DataFrame({
+        "Title": movies["Title"],
+        "imdbID": movies["imdbID"],
+        "Year": movies["Year"],
+        "Genre": movies["Genre"],
+        "Director": movies["Director"],
+        "Actors": movies["Actors"],
+        "Language": movies["Language"],
+        "Country": movies["Country"],
+        "Runtime": movies["Runtime"].astype(str) + " min",
+        "BoxOffice": movies["revenue"].astype(float).where(movies["has_boxoffice"]),
+        "imdbRating": movies["imdbRating"],
+        "imdbVotes": movies["imdbVotes"].astype(float),
+        "Awards": "N/A",
+        "Type": "movie",
+        "budget": movies["budget"].astype(float),
+    })
+
+
+def to_tmdb(movies):
+    # same columns as Sentiment_analysis_2/tmdb_movie_data.csv
+    return pd.DataFrame({
+        "title": movies["Title"],
+        "revenue": movies["revenue"],
+        "budget": movies["budget"],
+        "vote_average": np.round(movies["imdbRating"] + 0.3, 3),
+        "vote_count": movies["imdbVotes"] // 60 + 1,
+        "release_date": movies["Released"].dt.strftime("%Y-%m-%d"),
+        "genres": movies["Genre"],
+    })
+
+
+def to_box_office(movies):
+    # same columns as Sentiment_analysis_2/box_office_data.csv
+    return pd.DataFrame({"title": movies["Title"], "worldwide_gross": movies["worldwide_gross"]})
+
+
+def write_reviews(rng, movies, f, reviews_per_movie):
+    # same layout as Sentiment_analysis_2/imdb_reviews.txt; better rated
+    # movies get a larger share of positive reviews
+    p_positive = np.clip((movies["imdbRating"].to_numpy() - 2.0) / 8.0, 0.05, 0.95)
+    for title, p in zip(movies["Title"], p_positive):
+        f.write(f"\n=== Reviews for {title} ===\n")
+        kinds = rng.choice(3, size=reviews_per_movie, p=[p * 0.9, (1 - p) * 0.9, 0.1])
+        for i, kind in enumerate(kinds, 1):
+            pool = (POSITIVE_PHRASES, NEGATIVE_PHRASES, NEUTRAL_PHRASES)[kind]
+            f.write(f"Review {i}: " + " ".join(rng.choice(pool, size=3)) + "\n")
+
+
+def _manifest(n_movies, reviews_per_movie, seed):
+    return {"generator_version": GENERATOR_VERSION, "n_movies": n_movies,
+            "reviews_per_movie": reviews_per_movie, "seed": seed}
+
+
+def dataset_is_current(output_dir, n_movies, reviews_per_movie=5, seed=42):
+    """True if ``output_dir`` holds a finished dataset made with these settings."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f) == _manifest(n_movies, reviews_per_movie, seed)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+
+
+def generate_dataset(n_movies, output_dir, reviews_per_movie=5, seed=42):
+    """Write a full synthetic dataset of ``n_movies`` movies into ``output_dir``."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    rng = np.random.default_rng(seed)
+
+    outputs = {
+        "movie_data.csv": to_omdb_raw,
+        "omdb_cleaned.csv": to_omdb_cleaned,
+        "tmdb_movie_data.csv": to_tmdb,
+        "box_office_data.csv": to_box_office,
+    }
+    reviews_path = os.path.join(output_dir, "imdb_reviews.txt")
+
+    with open(reviews_path, "w", encoding="utf-8") as reviews_file:
+        for start in range(0, n_movies, CHUNK_SIZE):
+            movies = generate_movies(rng, start, min(CHUNK_SIZE, n_movies - start))
+            for file_name, convert in outputs.items():
+                convert(movies).to_csv(os.path.join(output_dir, file_name),
+                                       mode="w" if start == 0 else "a",
+                                       header=start == 0, index=False)
+            write_reviews(rng, movies, reviews_file, reviews_per_movie)
+            print(f"[{min(start + CHUNK_SIZE, n_movies)}/{n_movies}] movies written to {output_dir}")
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(_manifest(n_movies, reviews_per_movie, seed), f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic OMDb/TMDb/box office data and reviews.")
+    parser.add_argument("sizes", nargs="*", default=list(SIZES), choices=list(SIZES),
+                        help="dataset sizes to generate (default: all)")
+    parser.add_argument("--reviews-per-movie", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=synthetic_dir)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        generate_dataset(SIZES[size], os.path.join(args.output_dir, size), args.reviews_per_movie, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg") # plots are only saved, never shown
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import psutil
+
+# this script times each stage of the pipeline on the synthetic datasets from
+# generate_synthetic_data.py and records runtime and peak memory, so we can
+# catch regressions and see which stage becomes the bottleneck at scale.
+
+# dynamic paths to use on different PCs
+base_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(base_dir, ".."))
+sys.path.insert(0, os.path.join(project_root, "Sentiment_analysis_2"))
+
+import preprocess_data
+import sentiment_analysis_pipeline
+import streaming_stats
+from generate_synthetic_data import SIZES, dataset_is_current, generate_dataset, synthetic_dir
+
+STAGES = ["ratings_parsing", "merge", "sentiment_scoring", "correlation", "streaming_correlation",
+          "model_fit", "revenue_sketch"]
+
+
+def fit_revenue_model(df):
+    # log-linear revenue model from the modelling section of main-report.qmd
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import train_test_split
+
+    df["Runtime_clean"] = df["Runtime"].str.extract(r'(\d+)').astype(float)
+    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
+    df["Decade"] = (df["Year"] // 10 * 10).astype("Int64").astype(str) + "s"
+
+    features = ["BoxOffice", "budget", "imdbRating", "imdbVotes", "Runtime_clean", "Decade", "Genre"]
+    df_model = df[features].dropna().copy()
+    df_model = df_model[(df_model["budget"] > 0) & (df_model["BoxOffice"] > 0)].copy()
+    df_model["log_revenue"] = np.log(df_model["BoxOffice"])
+    df_model["log_budget"] = np.log(df_model["budget"])
+    df_model = pd.get_dummies(df_model, columns=["Decade", "Genre"], drop_first=True)
+
+    X = df_model.drop(columns=["BoxOffice", "budget", "log_revenue"])
+    y = df_model["log_revenue"]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+    return model
+
+
+class RSSSampler(threading.Thread):
+    """Polls the process RSS in the background and keeps the highest value."""
+
+    def __init__(self, interval=0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak = self.process.memory_info().rss
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def measure(func, repeat, trace_memory=False):
+    """Run ``func`` and return (result, best seconds, peak RSS MB, peak traced MB).
+
+    Peak RSS of the whole process is sampled during the timed runs, so it
+    costs no extra run. With ``trace_memory`` one more run under tracemalloc
+    gives the peak of Python allocations; it is off by default since it
+    slows allocation heavy stages down a lot.
+    """
+    best = float("inf")
+    sampler = RSSSampler()
+    sampler.start()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+            plt.close("all")
+    finally:
+        sampler.stop()
+
+    peak_traced_mb = np.nan
+    if trace_memory:
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        plt.close("all")
+        peak_traced_mb = peak / 1024 ** 2
+    return result, best, sampler.peak / 1024 ** 2, peak_traced_mb
+
+
+def run_size(size, data_dir, stages, repeat, trace_memory, results, output_path):
+    def record(stage, func):
+        result, seconds, peak_rss_mb, peak_traced_mb = measure(func, repeat, trace_memory)
+        traced = f" {peak_traced_mb:10.1f} MB traced" if trace_memory else ""
+        print(f"[{size}] {stage:<21} {seconds:10.3f} s {peak_rss_mb:10.1f} MB RSS{traced}")
+        row = {"size": size, "stage": stage, "seconds": seconds,
+               "peak_rss_mb": peak_rss_mb, "peak_traced_mb": peak_traced_mb}
+        results.append(row)
+        # written straight away so a crash at a large size keeps what was measured
+        pd.DataFrame([row]).to_csv(output_path, mode="a", header=not os.path.exists(output_path), index=False)
+        return result
+
+    df_tmdb, df_omdb, df_box_office = preprocess_data.load_datasets(
+        os.path.join(data_dir, "tmdb_movie_data.csv"),
+        os.path.join(data_dir, "movie_data.csv"),
+        os.path.join(data_dir, "box_office_data.csv"),
+    )
+
+    # later stages depend on earlier outputs, so those are computed untimed
+    # when the stage itself was not selected
+    if "ratings_parsing" in stages:
+        df_omdb_processed = record("ratings_parsing", lambda: preprocess_data.process_omdb(df_omdb))
+    else:
+        df_omdb_processed = preprocess_data.process_omdb(df_omdb)
+
+    df_tmdb_processed = preprocess_data.process_tmdb(df_tmdb)
+    df_box_office_processed = preprocess_data.process_box_office(df_box_office)
+    merge = lambda: preprocess_data.merge_datasets(df_tmdb_processed, df_omdb_processed, df_box_office_processed)
+    df_merged = record("merge", merge) if "merge" in stages else merge()
+
+    merged_path = os.path.join(data_dir, "merged_movie_data.csv")
+    df_merged.to_csv(merged_path, index=False)
+    del df_tmdb, df_omdb, df_box_office, df_omdb_processed, df_merged
+
+    if {"sentiment_scoring", "correlation", "streaming_correlation"} & set(stages):
+        reviews_path = os.path.join(data_dir, "imdb_reviews.txt")
+        score = lambda: sentiment_analysis_pipeline.analyze_sentiment(sentiment_analysis_pipeline.read_reviews(reviews_path))
+        try:
+            _, df_summary = record("sentiment_scoring", score) if "sentiment_scoring" in stages else score()
+        except LookupError:
+            print("VADER lexicon not found, run nltk.download('vader_lexicon') first. Skipping sentiment and correlation.")
+            df_summary = None
+
+        if "correlation" in stages and df_summary is not None:
+            with tempfile.TemporaryDirectory() as output_dir:
+                record("correlation", lambda: sentiment_analysis_pipeline.perform_correlation_analysis(
+                    merged_path, df_summary, output_dir))
+
+        if "streaming_correlation" in stages and df_summary is not None:
+            with tempfile.TemporaryDirectory() as output_dir:
+                record("streaming_correlation", lambda: sentiment_analysis_pipeline.perform_streaming_correlation_analysis(
+                    merged_path, df_summary, output_dir))
+
+    if "model_fit" in stages:
+        df_cleaned = pd.read_csv(os.path.join(data_dir, "omdb_cleaned.csv"))
+        record("model_fit", lambda: fit_revenue_model(df_cleaned.copy()))
+
+    if "revenue_sketch" in stages:
+        cleaned_path = os.path.join(data_dir, "omdb_cleaned.csv")
+        record("revenue_sketch", lambda: streaming_stats.revenue_sketch(cleaned_path, min_value=1e5).top_share(0.2))
+
+
+def compare_to_baseline(df_results, df_baseline, tolerance):
+    """Print stages that got slower or bigger than the baseline, or are missing
+    from this run (e.g. skipped for lack of the VADER lexicon); return True if any."""
+    df_cmp = pd.merge(df_results, df_baseline, on=["size", "stage"], suffixes=("", "_baseline"))
+    # older result files may not have every metric
+    metrics = [m for m in ["seconds", "peak_rss_mb", "peak_traced_mb"] if m in df_baseline.columns]
+    regressed = False
+    for _, row in df_cmp.iterrows():
+        for metric in metrics:
+            # NaN (not measured in one of the runs) never compares as greater
+            if row[metric] > row[f"{metric}_baseline"] * (1 + tolerance):
+                print(f"REGRESSION [{row['size']}] {row['stage']} {metric}: "
+                      f"{row[f'{metric}_baseline']:.3f} -> {row[metric]:.3f}")
+                regressed = True
+
+    # only sizes benchmarked in this run are expected to be complete
+    df_expected = df_baseline[df_baseline["size"].isin(df_results["size"])]
+    df_missing = pd.merge(df_expected, df_results[["size", "stage"]], on=["size", "stage"], how="left", indicator=True)
+    for _, row in df_missing[df_missing["_merge"] == "left_only"].iterrows():
+        print(f"MISSING [{row['size']}] {row['stage']}: in the baseline but not measured in this run")
+        regressed = True
+
+    if not regressed:
+        print(f"No regressions against the baseline (tolerance {tolerance:.0%}).")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic data.")
+    parser.add_argument("sizes", nargs="*", default=["10k"], choices=list(SIZES),
+                        help="dataset sizes to benchmark (default: 10k)")
+    parser.add_argument("--stages", nargs="+", default=STAGES, choices=STAGES)
+    parser.add_argument("--repeat", type=int, default=1, help="timing runs per stage, best one is kept")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="also run each stage once under tracemalloc for the peak of Python allocations "
+                             "(the extra runs raise the RSS of later stages, so compare against a traced baseline)")
+    parser.add_argument("--data-dir", default=synthetic_dir)
+    parser.add_argument("--output", default=os.path.join(base_dir, "benchmark_results.csv"))
+    parser.add_argument("--baseline", help="results CSV from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    # read the baseline before the output is cleared, they may be the same file
+    df_baseline = pd.read_csv(args.baseline) if args.baseline else None
+    if os.path.exists(args.output):
+        os.remove(args.output)
+
+    results = []
+    regressed = False
+    try:
+        for size in args.sizes:
+            data_dir = os.path.join(args.data_dir, size)
+            if not dataset_is_current(data_dir, SIZES[size]):
+                # missing, interrupted or made by an older version of the generator
+                generate_dataset(SIZES[size], data_dir)
+            run_size(size, data_dir, args.stages, args.repeat, args.trace_memory, results, args.output)
+    finally:
+        # still compare whatever finished if a later size or stage crashed
+        if results:
+            print(f"Saved benchmark results to {args.output}")
+            if df_baseline is not None:
+                regressed = compare_to_baseline(pd.DataFrame(results), df_baseline, args.tolerance)
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()